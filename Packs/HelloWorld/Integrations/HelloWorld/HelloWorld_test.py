@@ -52,15 +52,28 @@ https://xsoar.pan.dev/docs/integrations/unit-testing
 
 """
 
+import copy
+import functools
 import json
-import io
 
 import pytest
 
+try:
+    import orjson as _json  # considerably faster than stdlib json on fixture-sized files
+except ImportError:
+    _json = json
+
+
+@functools.lru_cache(maxsize=None)
+def _util_load_json_cached(path):
+    with open(path, 'rb') as f:
+        return _json.loads(f.read())
+
 
 def util_load_json(path):
-    with io.open(path, mode='r', encoding='utf-8') as f:
-        return json.loads(f.read())
+    # Several tests mutate the returned data (e.g. overriding timestamps),
+    # so hand each caller its own copy of the cached parse.
+    return copy.deepcopy(_util_load_json_cached(path))
 
 
 def test_say_hello():
@@ -1,16 +1,20 @@
 import demistomock as demisto  # noqa: F401
 from CommonServerPython import *  # noqa: F401
 
+TABLE_FORMAT = formats["table"]
+NOTE_TYPE = entryTypes["note"]
 
 resp = demisto.executeCommand("incap-list-sites", demisto.args())
 
 if isError(resp[0]):
     demisto.results(resp)
 else:
-    data = demisto.get(resp[0], "Contents.sites")
+    data = (resp[0].get("Contents") or {}).get("sites")
     if data:
-        data = data if isinstance(data, list) else [data]
-        data = [{k: formatCell(row[k]) for k in row} for row in data]
-        demisto.results({"ContentsFormat": formats["table"], "Type": entryTypes["note"], "Contents": data})
+        if isinstance(data, list):
+            data = [dict(zip(row, map(formatCell, row.values()))) for row in data]
+        else:
+            data = [dict(zip(data, map(formatCell, data.values())))]
+        demisto.results({"ContentsFormat": TABLE_FORMAT, "Type": NOTE_TYPE, "Contents": data})
     else:
         demisto.results("No results.")